@@ -3,7 +3,6 @@ import base64
 import copy
 import os
 import pickle
-import re
 from collections import defaultdict
 from logging import INFO
 
@@ -198,8 +197,7 @@ def get_multicast_ip_list(urls):
     """
     ip_list = []
     for url in urls:
-        pattern = r"rtp://((\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})(?::(\d+))?)"
-        matcher = re.search(pattern, url)
+        matcher = constants.multicast_ip_pattern.search(url)
         if matcher:
             ip_list.append(matcher.group(1))
     return ip_list
@@ -1,8 +1,14 @@
 import configparser
+import functools
 import os
 import re
 import shutil
 import sys
+from pathlib import Path
+from types import MappingProxyType
+
+_resolution_pattern = re.compile(r"(\d+)[xX*](\d+)")
+_true_values = frozenset({"1", "yes", "true", "on"})
 
 
 def resource_path(relative_path, persistent=False):
@@ -21,12 +27,14 @@ def resource_path(relative_path, persistent=False):
             return total_path
 
 
+@functools.lru_cache(maxsize=64)
 def get_resolution_value(resolution_str):
     """
     Get resolution value from string
     """
-    pattern = r"(\d+)[xX*](\d+)"
-    match = re.search(pattern, resolution_str)
+    if not resolution_str:
+        return 0
+    match = _resolution_pattern.search(resolution_str)
     if match:
         width, height = map(int, match.groups())
         return width * height
@@ -34,82 +42,90 @@ def get_resolution_value(resolution_str):
         return 0
 
 
+def get_resolution_values(resolution_list):
+    """
+    Get resolution values from a list of strings
+    """
+    return [get_resolution_value(resolution_str) for resolution_str in resolution_list]
+
+
 class ConfigManager:
 
     def __init__(self):
         self.config = None
+        self._options: dict[tuple[str, str], str] = {}
         self.load()
 
     def __getattr__(self, name, *args, **kwargs):
         return getattr(self.config, name, *args, **kwargs)
 
-    @property
+    @functools.cached_property
     def open_service(self):
-        return self.config.getboolean("Settings", "open_service", fallback=True)
+        return self._getboolean("Settings", "open_service", fallback=True)
 
-    @property
+    @functools.cached_property
     def open_update(self):
-        return self.config.getboolean("Settings", "open_update", fallback=True)
+        return self._getboolean("Settings", "open_update", fallback=True)
 
-    @property
+    @functools.cached_property
     def open_use_cache(self):
-        return self.config.getboolean("Settings", "open_use_cache", fallback=True)
+        return self._getboolean("Settings", "open_use_cache", fallback=True)
 
-    @property
+    @functools.cached_property
     def open_request(self):
-        return self.config.getboolean("Settings", "open_request", fallback=False)
+        return self._getboolean("Settings", "open_request", fallback=False)
 
-    @property
+    @functools.cached_property
     def open_filter_speed(self):
-        return self.config.getboolean(
+        return self._getboolean(
             "Settings", "open_filter_speed", fallback=True
         )
 
-    @property
+    @functools.cached_property
     def open_filter_resolution(self):
-        return self.config.getboolean(
+        return self._getboolean(
             "Settings", "open_filter_resolution", fallback=True
         )
 
-    @property
+    @functools.cached_property
     def ipv_type(self):
-        return self.config.get("Settings", "ipv_type", fallback="全部").lower()
+        return self._get("Settings", "ipv_type", fallback="全部").lower()
 
-    @property
+    @functools.cached_property
     def open_ipv6(self):
         return (
                 "ipv6" in self.ipv_type or "all" in self.ipv_type or "全部" in self.ipv_type
         )
 
-    @property
+    @functools.cached_property
     def ipv_type_prefer(self):
         return [
             ipv_type_value.lower()
-            for ipv_type in self.config.get(
+            for ipv_type in self._get(
                 "Settings", "ipv_type_prefer", fallback=""
             ).split(",")
             if (ipv_type_value := ipv_type.strip())
         ]
 
-    @property
+    @functools.cached_property
     def ipv4_num(self):
         try:
-            return self.config.getint("Settings", "ipv4_num", fallback=5)
+            return self._getint("Settings", "ipv4_num", fallback=5)
         except:
             return ""
 
-    @property
+    @functools.cached_property
     def ipv6_num(self):
         try:
-            return self.config.getint("Settings", "ipv6_num", fallback=5)
+            return self._getint("Settings", "ipv6_num", fallback=5)
         except:
             return ""
 
-    @property
+    @functools.cached_property
     def ipv6_support(self):
-        return self.config.getboolean("Settings", "ipv6_support", fallback=False)
+        return self._getboolean("Settings", "ipv6_support", fallback=False)
 
-    @property
+    @functools.cached_property
     def ipv_limit(self):
         return {
             "all": self.urls_limit,
@@ -117,11 +133,11 @@ class ConfigManager:
             "ipv6": self.ipv6_num,
         }
 
-    @property
+    @functools.cached_property
     def origin_type_prefer(self):
         return [
             origin_value.lower()
-            for origin in self.config.get(
+            for origin in self._get(
                 "Settings",
                 "origin_type_prefer",
                 fallback="",
@@ -129,23 +145,23 @@ class ConfigManager:
             if (origin_value := origin.strip())
         ]
 
-    @property
+    @functools.cached_property
     def hotel_num(self):
-        return self.config.getint("Settings", "hotel_num", fallback=10)
+        return self._getint("Settings", "hotel_num", fallback=10)
 
-    @property
+    @functools.cached_property
     def multicast_num(self):
-        return self.config.getint("Settings", "multicast_num", fallback=10)
+        return self._getint("Settings", "multicast_num", fallback=10)
 
-    @property
+    @functools.cached_property
     def subscribe_num(self):
-        return self.config.getint("Settings", "subscribe_num", fallback=10)
+        return self._getint("Settings", "subscribe_num", fallback=10)
 
-    @property
+    @functools.cached_property
     def online_search_num(self):
-        return self.config.getint("Settings", "online_search_num", fallback=10)
+        return self._getint("Settings", "online_search_num", fallback=10)
 
-    @property
+    @functools.cached_property
     def source_limits(self):
         return {
             "all": self.urls_limit,
@@ -156,83 +172,83 @@ class ConfigManager:
             "online_search": self.online_search_num,
         }
 
-    @property
+    @functools.cached_property
     def min_speed(self):
-        return self.config.getfloat("Settings", "min_speed", fallback=0.5)
+        return self._getfloat("Settings", "min_speed", fallback=0.5)
 
-    @property
+    @functools.cached_property
     def min_resolution(self):
-        return self.config.get("Settings", "min_resolution", fallback="1920x1080")
+        return self._get("Settings", "min_resolution", fallback="1920x1080")
 
-    @property
+    @functools.cached_property
     def min_resolution_value(self):
         return get_resolution_value(self.min_resolution)
 
-    @property
+    @functools.cached_property
     def urls_limit(self):
-        return self.config.getint("Settings", "urls_limit", fallback=30)
+        return self._getint("Settings", "urls_limit", fallback=30)
 
-    @property
+    @functools.cached_property
     def open_url_info(self):
-        return self.config.getboolean("Settings", "open_url_info", fallback=True)
+        return self._getboolean("Settings", "open_url_info", fallback=True)
 
-    @property
+    @functools.cached_property
     def recent_days(self):
-        return self.config.getint("Settings", "recent_days", fallback=30)
+        return self._getint("Settings", "recent_days", fallback=30)
 
-    @property
+    @functools.cached_property
     def source_file(self):
-        return self.config.get("Settings", "source_file", fallback="config/demo.txt")
+        return self._get("Settings", "source_file", fallback="config/demo.txt")
 
-    @property
+    @functools.cached_property
     def final_file(self):
-        return self.config.get("Settings", "final_file", fallback="output/result.txt")
+        return self._get("Settings", "final_file", fallback="output/result.txt")
 
-    @property
+    @functools.cached_property
     def open_m3u_result(self):
-        return self.config.getboolean("Settings", "open_m3u_result", fallback=True)
+        return self._getboolean("Settings", "open_m3u_result", fallback=True)
 
-    @property
+    @functools.cached_property
     def open_keep_all(self):
-        return self.config.getboolean("Settings", "open_keep_all", fallback=False)
+        return self._getboolean("Settings", "open_keep_all", fallback=False)
 
-    @property
+    @functools.cached_property
     def open_subscribe(self):
-        return self.config.getboolean("Settings", f"open_subscribe", fallback=True)
+        return self._getboolean("Settings", f"open_subscribe", fallback=True)
 
-    @property
+    @functools.cached_property
     def open_hotel(self):
-        return self.config.getboolean("Settings", f"open_hotel", fallback=True)
+        return self._getboolean("Settings", f"open_hotel", fallback=True)
 
-    @property
+    @functools.cached_property
     def open_hotel_fofa(self):
-        return self.config.getboolean("Settings", f"open_hotel_fofa", fallback=True)
+        return self._getboolean("Settings", f"open_hotel_fofa", fallback=True)
 
-    @property
+    @functools.cached_property
     def open_hotel_foodie(self):
-        return self.config.getboolean("Settings", f"open_hotel_foodie", fallback=True)
+        return self._getboolean("Settings", f"open_hotel_foodie", fallback=True)
 
-    @property
+    @functools.cached_property
     def open_multicast(self):
-        return self.config.getboolean("Settings", f"open_multicast", fallback=True)
+        return self._getboolean("Settings", f"open_multicast", fallback=True)
 
-    @property
+    @functools.cached_property
     def open_multicast_fofa(self):
-        return self.config.getboolean("Settings", f"open_multicast_fofa", fallback=True)
+        return self._getboolean("Settings", f"open_multicast_fofa", fallback=True)
 
-    @property
+    @functools.cached_property
     def open_multicast_foodie(self):
-        return self.config.getboolean(
+        return self._getboolean(
             "Settings", f"open_multicast_foodie", fallback=True
         )
 
-    @property
+    @functools.cached_property
     def open_online_search(self):
-        return self.config.getboolean("Settings", f"open_online_search", fallback=True)
+        return self._getboolean("Settings", f"open_online_search", fallback=True)
 
-    @property
+    @functools.cached_property
     def open_method(self):
-        return {
+        return MappingProxyType({
             "local": self.open_local,
             "subscribe": self.open_subscribe,
             "hotel": self.open_hotel,
@@ -242,117 +258,156 @@ class ConfigManager:
             "hotel_foodie": self.open_hotel and self.open_hotel_foodie,
             "multicast_fofa": self.open_multicast and self.open_multicast_fofa,
             "multicast_foodie": self.open_multicast and self.open_multicast_foodie,
-        }
+        })
 
-    @property
+    @functools.cached_property
     def open_history(self):
-        return self.config.getboolean("Settings", "open_history", fallback=True)
+        return self._getboolean("Settings", "open_history", fallback=True)
 
-    @property
+    @functools.cached_property
     def open_sort(self):
-        return self.config.getboolean("Settings", "open_sort", fallback=True)
+        return self._getboolean("Settings", "open_sort", fallback=True)
 
-    @property
+    @functools.cached_property
     def open_update_time(self):
-        return self.config.getboolean("Settings", "open_update_time", fallback=True)
+        return self._getboolean("Settings", "open_update_time", fallback=True)
 
-    @property
+    @functools.cached_property
     def multicast_region_list(self):
         return [
             region.strip()
-            for region in self.config.get(
+            for region in self._get(
                 "Settings", "multicast_region_list", fallback="全部"
             ).split(",")
             if region.strip()
         ]
 
-    @property
+    @functools.cached_property
     def hotel_region_list(self):
         return [
             region.strip()
-            for region in self.config.get(
+            for region in self._get(
                 "Settings", "hotel_region_list", fallback="全部"
             ).split(",")
             if region.strip()
         ]
 
-    @property
+    @functools.cached_property
     def request_timeout(self):
-        return self.config.getint("Settings", "request_timeout", fallback=10)
+        return self._getint("Settings", "request_timeout", fallback=10)
 
-    @property
+    @functools.cached_property
     def sort_timeout(self):
-        return self.config.getint("Settings", "sort_timeout", fallback=10)
+        return self._getint("Settings", "sort_timeout", fallback=10)
 
-    @property
+    @functools.cached_property
     def open_proxy(self):
-        return self.config.getboolean("Settings", "open_proxy", fallback=False)
+        return self._getboolean("Settings", "open_proxy", fallback=False)
 
-    @property
+    @functools.cached_property
     def open_driver(self):
-        return self.config.getboolean(
+        return self._getboolean(
             "Settings", "open_driver", fallback=False
         )
 
-    @property
+    @functools.cached_property
     def hotel_page_num(self):
-        return self.config.getint("Settings", "hotel_page_num", fallback=1)
+        return self._getint("Settings", "hotel_page_num", fallback=1)
 
-    @property
+    @functools.cached_property
     def multicast_page_num(self):
-        return self.config.getint("Settings", "multicast_page_num", fallback=1)
+        return self._getint("Settings", "multicast_page_num", fallback=1)
 
-    @property
+    @functools.cached_property
     def online_search_page_num(self):
-        return config.getint("Settings", "online_search_page_num", fallback=1)
+        return self._getint("Settings", "online_search_page_num", fallback=1)
 
-    @property
+    @functools.cached_property
     def open_empty_category(self):
-        return self.config.getboolean("Settings", "open_empty_category", fallback=True)
+        return self._getboolean("Settings", "open_empty_category", fallback=True)
 
     @property
     def app_host(self):
-        return os.environ.get("APP_HOST") or self.config.get("Settings", "app_host", fallback="http://localhost")
+        return os.environ.get("APP_HOST") or self._get("Settings", "app_host", fallback="http://localhost")
 
     @property
     def app_port(self):
-        return os.environ.get("APP_PORT") or self.config.getint("Settings", "app_port", fallback=8000)
+        return os.environ.get("APP_PORT") or self._getint("Settings", "app_port", fallback=8000)
 
-    @property
+    @functools.cached_property
     def open_supply(self):
-        return self.config.getboolean("Settings", "open_supply", fallback=True)
+        return self._getboolean("Settings", "open_supply", fallback=True)
 
-    @property
+    @functools.cached_property
     def update_time_position(self):
-        return self.config.get("Settings", "update_time_position", fallback="top")
+        return self._get("Settings", "update_time_position", fallback="top")
 
-    @property
+    @functools.cached_property
     def time_zone(self):
-        return self.config.get("Settings", "time_zone", fallback="Asia/Shanghai")
+        return self._get("Settings", "time_zone", fallback="Asia/Shanghai")
 
-    @property
+    @functools.cached_property
     def open_local(self):
-        return self.config.getboolean("Settings", "open_local", fallback=True)
+        return self._getboolean("Settings", "open_local", fallback=True)
 
-    @property
+    @functools.cached_property
     def local_file(self):
-        return self.config.get("Settings", "local_file", fallback="config/local.txt")
+        return self._get("Settings", "local_file", fallback="config/local.txt")
 
-    @property
+    @functools.cached_property
     def local_num(self):
-        return self.config.getint("Settings", "local_num", fallback=10)
+        return self._getint("Settings", "local_num", fallback=10)
 
-    @property
+    @functools.cached_property
     def sort_duplicate_limit(self):
-        return self.config.getint("Settings", "sort_duplicate_limit", fallback=3)
+        return self._getint("Settings", "sort_duplicate_limit", fallback=3)
 
-    @property
+    @functools.cached_property
     def cdn_url(self):
-        return self.config.get("Settings", "cdn_url", fallback="")
+        return self._get("Settings", "cdn_url", fallback="")
 
-    @property
+    @functools.cached_property
     def open_rtmp(self):
-        return self.config.getboolean("Settings", "open_rtmp", fallback=False)
+        return self._getboolean("Settings", "open_rtmp", fallback=False)
+
+    def _get(self, section, key, fallback=None):
+        value = self._options.get((section, key))
+        if value is None:
+            return fallback
+        if "%" in value:
+            return self.config.get(section, key)
+        return value
+
+    def _getint(self, section, key, fallback=None):
+        value = self._get(section, key)
+        return fallback if value is None else int(value)
+
+    def _getfloat(self, section, key, fallback=None):
+        value = self._get(section, key)
+        return fallback if value is None else float(value)
+
+    def _getboolean(self, section, key, fallback=None):
+        value = self._get(section, key)
+        return fallback if value is None else value.lower() in _true_values
+
+    def _load_options(self):
+        """
+        Flatten the raw config values into a dict keyed by section and key
+        """
+        self._options = {
+            (section, key): value
+            for section in self.config.sections()
+            for key, value in self.config.items(section, raw=True)
+        }
+        self.clear_cache()
+
+    def clear_cache(self):
+        """
+        Clear the cached property values
+        """
+        for name, value in vars(type(self)).items():
+            if isinstance(value, functools.cached_property):
+                self.__dict__.pop(name, None)
 
     def load(self):
         """
@@ -365,15 +420,19 @@ class ConfigManager:
         # user config overwrites default config
         config_files = [default_config_path, user_config_path]
         for config_file in config_files:
-            if os.path.exists(config_file):
-                with open(config_file, "r", encoding="utf-8") as f:
-                    self.config.read_file(f)
+            try:
+                text = Path(config_file).read_text(encoding="utf-8")
+            except FileNotFoundError:
+                continue
+            self.config.read_string(text, source=config_file)
+        self._load_options()
 
     def set(self, section, key, value):
         """
         Set the config
         """
         self.config.set(section, key, value)
+        self._load_options()
 
     def save(self):
         """
@@ -385,8 +444,7 @@ class ConfigManager:
             else "config.ini"
         )
         user_config_path = resource_path(user_config_file, persistent=True)
-        if not os.path.exists(user_config_path):
-            os.makedirs(os.path.dirname(user_config_path), exist_ok=True)
+        os.makedirs(os.path.dirname(user_config_path), exist_ok=True)
         with open(user_config_path, "w", encoding="utf-8") as configfile:
             self.config.write(configfile)
 
@@ -398,23 +456,23 @@ class ConfigManager:
         try:
             src_dir = resource_path(path)
             if os.path.exists(src_dir):
-                if not os.path.exists(dest_folder):
-                    os.makedirs(dest_folder, exist_ok=True)
-
-                for root, _, files in os.walk(src_dir):
-                    for file in files:
-                        src_file_path = os.path.join(root, file)
-                        relative_path = os.path.relpath(src_file_path, src_dir)
-                        dest_file_path = os.path.join(dest_folder, relative_path)
-
-                        dest_file_dir = os.path.dirname(dest_file_path)
-                        if not os.path.exists(dest_file_dir):
-                            os.makedirs(dest_file_dir, exist_ok=True)
-
-                        if not os.path.exists(dest_file_path):
-                            shutil.copy(src_file_path, dest_file_path)
+                shutil.copytree(
+                    src_dir,
+                    dest_folder,
+                    copy_function=self._copy_missing_file,
+                    dirs_exist_ok=True,
+                )
         except Exception as e:
             print(f"Failed to copy files: {str(e)}")
 
+    @staticmethod
+    def _copy_missing_file(src, dst):
+        """
+        Copy the file unless it already exists, keeping user modified files
+        """
+        if os.path.exists(dst):
+            return dst
+        return shutil.copy(src, dst)
+
 
 config = ConfigManager()
@@ -47,6 +47,16 @@ rt_url_pattern = re.compile(r"^(rtmp|rtsp)://.*$")
 
 rtp_pattern = re.compile(r"^([^,，]+)[,，]?(rtp://.*)$")
 
+multicast_ip_pattern = re.compile(r"rtp://((\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})(?::(\d+))?)")
+
+cctv_name_pattern = re.compile(r"(CCTV|CETV)-(\d+)(\+.*)?")
+
+cache_info_pattern = re.compile(r"[.*]?\$?-?cache:.*")
+
+video_frame_pattern = re.compile(r"frame=(\d+)")
+
+video_resolution_pattern = re.compile(r"(\d{3,4}x\d{3,4})")
+
 demo_txt_pattern = re.compile(r"^([^,，]+)[,，]?(?!#genre#)" + r"(" + url_pattern.pattern + r")?")
 
 txt_pattern = re.compile(r"^([^,，]+)[,，](?!#genre#)" + r"(" + url_pattern.pattern + r")")
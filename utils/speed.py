@@ -1,7 +1,5 @@
 import asyncio
 import http.cookies
-import json
-import re
 import subprocess
 from time import time
 from urllib.parse import quote, urlparse
@@ -12,7 +10,7 @@ from multidict import CIMultiDictProxy
 
 import utils.constants as constants
 from utils.config import config
-from utils.tools import get_resolution_value
+from utils.tools import get_resolution_value, json_loads
 from utils.types import TestResult, ChannelTestResult, TestResultCacheData
 
 http.cookies._is_legal_key = lambda _: True
@@ -225,7 +223,7 @@ async def get_resolution_ffprobe(url: str, timeout: int = config.sort_timeout) -
         proc = await asyncio.create_subprocess_exec(*probe_args, stdout=asyncio.subprocess.PIPE,
                                                     stderr=asyncio.subprocess.PIPE)
         out, _ = await asyncio.wait_for(proc.communicate(), timeout)
-        video_stream = json.loads(out.decode('utf-8'))["streams"][0]
+        video_stream = json_loads(out)["streams"][0]
         resolution = f"{video_stream['width']}x{video_stream['height']}"
     except:
         if proc:
@@ -244,10 +242,10 @@ def get_video_info(video_info):
     resolution = None
     if video_info is not None:
         info_data = video_info.replace(" ", "")
-        matches = re.findall(r"frame=(\d+)", info_data)
+        matches = constants.video_frame_pattern.findall(info_data)
         if matches:
             frame_size = int(matches[-1])
-        match = re.search(r"(\d{3,4}x\d{3,4})", video_info)
+        match = constants.video_resolution_pattern.search(video_info)
         if match:
             resolution = match.group(0)
     return frame_size, resolution
@@ -18,9 +18,14 @@ from flask import send_file, make_response
 from opencc import OpenCC
 
 import utils.constants as constants
-from utils.config import config, resource_path
+from utils.config import config, resource_path, get_resolution_value
 from utils.types import ChannelData
 
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 
 def get_logger(path, level=logging.ERROR, init=False):
     """
@@ -133,22 +138,6 @@ def get_soup(source):
     return soup
 
 
-def get_resolution_value(resolution_str):
-    """
-    Get resolution value from string
-    """
-    try:
-        if resolution_str:
-            pattern = r"(\d+)[xX*](\d+)"
-            match = re.search(pattern, resolution_str)
-            if match:
-                width, height = map(int, match.groups())
-                return width * height
-    except:
-        pass
-    return 0
-
-
 def get_total_urls(info_list: list[ChannelData], ipv_type_prefer, origin_type_prefer, rtmp_type=None) -> list:
     """
     Get the total urls from info list
@@ -373,8 +362,7 @@ def convert_to_m3u(path=None, first_channel_name=None):
                             )
                         except:
                             continue
-                        processed_channel_name = re.sub(
-                            r"(CCTV|CETV)-(\d+)(\+.*)?",
+                        processed_channel_name = constants.cctv_name_pattern.sub(
                             lambda m: f"{m.group(1)}{m.group(2)}"
                                       + ("+" if m.group(3) else ""),
                             first_channel_name if current_group == "🕘️更新时间" else original_channel_name,
@@ -478,7 +466,7 @@ def remove_cache_info(string):
     """
     Remove the cache info from the string
     """
-    return re.sub(r"[.*]?\$?-?cache:.*", "", string)
+    return constants.cache_info_pattern.sub("", string)
 
 
 def resource_path(relative_path, persistent=False):
@@ -1,3 +1,4 @@
+from dataclasses import dataclass
 from typing import TypedDict, Literal, Union
 
 OriginType = Literal["live", "hls", "local", "whitelist", "subscribe", "hotel", "multicast", "online_search"]
@@ -17,6 +18,20 @@ class ChannelData(TypedDict):
     ipv_type: IPvType
 
 
+@dataclass(slots=True)
+class ChannelDataObj:
+    """
+    Slotted object form of ChannelData, for storing large channel lists
+    """
+    id: int
+    url: str
+    host: str
+    date: str | None
+    resolution: str | None
+    origin: OriginType
+    ipv_type: IPvType
+
+
 CategoryChannelData = dict[str, dict[str, list[ChannelData]]]
 
 